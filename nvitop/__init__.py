@@ -3,9 +3,37 @@
 
 """An interactive NVIDIA-GPU process viewer, the one-stop solution for GPU process management."""
 
-from nvitop import core
-from nvitop.core import *
-from nvitop.version import __version__
+# pylint: disable=redefined-outer-name
 
+import sys
 
-__all__ = core.__all__.copy()
+
+if sys.version_info >= (3, 7):
+    # Forward attribute access to nvitop.core lazily (PEP 562), so that importing a
+    # submodule such as nvitop.cli — the console-script path — does not eagerly
+    # load the NVML/psutil stack for `--help`/`--version`. The public API is
+    # unchanged: `from nvitop import Device` etc. resolve through __getattr__.
+    def __getattr__(name):
+        if name == '__version__':
+            from nvitop.version import __version__  # pylint: disable=import-outside-toplevel
+            return __version__
+
+        import nvitop.core as core  # pylint: disable=import-outside-toplevel,consider-using-from-import
+        if name == 'core':
+            return core
+        if name == '__all__':
+            return core.__all__.copy()
+        try:
+            return getattr(core, name)
+        except AttributeError:
+            raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name)) from None
+
+    def __dir__():
+        import nvitop.core as core  # pylint: disable=import-outside-toplevel,consider-using-from-import
+        return sorted(set(globals()).union(core.__all__, {'core', '__version__'}))
+else:
+    from nvitop import core
+    from nvitop.core import *  # pylint: disable=wildcard-import,unused-wildcard-import
+    from nvitop.version import __version__
+
+    __all__ = core.__all__.copy()
@@ -4,27 +4,108 @@
 # pylint: disable=missing-module-docstring,missing-function-docstring
 
 import argparse
-import curses
+import functools
 import os
 import sys
 
-from nvitop.core import nvml, HostProcess, boolify
-from nvitop.gui import Top, Device, libcurses, setlocale_utf8, colored, set_color, USERNAME
-from nvitop.version import __version__
 
+def _get_version():
+    version_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'version.py')
+    version = {'__file__': version_file}
+    with open(version_file) as file:  # pylint: disable=unspecified-encoding
+        exec(file.read(), version)  # pylint: disable=exec-used
+    return version['__version__']
 
-TTY = (sys.stdin.isatty() and sys.stdout.isatty())
 
+@functools.lru_cache(maxsize=None)
+def _is_tty():
+    return sys.stdin.isatty() and _stdout_isatty()
+
+
+@functools.lru_cache(maxsize=None)
+def _stdout_isatty():
+    return sys.stdout.isatty()
+
+
+class _LazyHelp:  # pylint: disable=too-few-public-methods
+    """Deferred help text. argparse only stringifies it when formatting the help
+    message, so building it here keeps `nvitop.gui` off the `--version`/error path."""
+
+    def __init__(self, func):
+        self._func = func
+
+    def __str__(self):
+        return self._func()
+
+    def __mod__(self, params):
+        return self._func() % params
+
+    def strip(self, *args):
+        return self._func().strip(*args)
+
+
+def _coloring_rules():
+    from nvitop.gui import colored  # pylint: disable=import-outside-toplevel
+
+    return '{} < th1 %% <= {} < th2 %% <= {}'.format(colored('light', 'green'),
+                                                     colored('moderate', 'yellow'),
+                                                     colored('heavy', 'red'))
+
+
+def _fast_parse_arguments():  # pylint: disable=too-many-branches
+    """Hand-rolled parser for the common flag-only invocations (e.g. no arguments,
+    `-m`, `-1`). Returns None on any unrecognized token so that the full argparse
+    parser handles the complex cases and keeps the error messages unchanged."""
+
+    args = argparse.Namespace(once=False, ascii=False, force_color=False, light=False,
+                              gpu_util_thresh=None, mem_util_thresh=None,
+                              only=None, only_visible=False,
+                              compute=False, graphics=False, user=None, pid=None)
+    argv = sys.argv[1:]
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ('-1', '--once'):
+            args.once = True
+        elif arg in ('-U', '--ascii', '--no-unicode'):
+            args.ascii = True
+        elif arg == '--force-color':
+            args.force_color = True
+        elif arg == '--light':
+            args.light = True
+        elif arg in ('-m', '--monitor'):
+            if i + 1 < len(argv) and argv[i + 1] in ('auto', 'full', 'compact'):
+                args.monitor = argv[i + 1]
+                i += 1
+            else:
+                args.monitor = None
+        else:
+            return None
+        i += 1
+    return args
+
+
+def _full_parse_arguments():  # pylint: disable=too-many-statements
+    def gpu_thresh_help():
+        from nvitop.gui import Device  # pylint: disable=import-outside-toplevel
+
+        return ('Thresholds of GPU utilization to determine the load intensity.\n' +
+                'Coloring rules: {}.\n'.format(_coloring_rules()) +
+                '( 1 <= th1 < th2 <= 99, defaults: {} {} )'.format(*Device.GPU_UTILIZATION_THRESHOLDS))
+
+    def mem_thresh_help():
+        from nvitop.gui import Device  # pylint: disable=import-outside-toplevel
+
+        return ('Thresholds of GPU memory percent to determine the load intensity.\n' +
+                'Coloring rules: {}.\n'.format(_coloring_rules()) +
+                '( 1 <= th1 < th2 <= 99, defaults: {} {} )'.format(*Device.MEMORY_UTILIZATION_THRESHOLDS))
 
-def parse_arguments():  # pylint: disable=too-many-branches,too-many-statements
-    coloring_rules = '{} < th1 %% <= {} < th2 %% <= {}'.format(colored('light', 'green'),
-                                                               colored('moderate', 'yellow'),
-                                                               colored('heavy', 'red'))
     parser = argparse.ArgumentParser(prog='nvitop', description='An interactive NVIDIA-GPU process viewer.',
                                      formatter_class=argparse.RawTextHelpFormatter, add_help=False)
     parser.add_argument('--help', '-h', dest='help', action='help', default=argparse.SUPPRESS,
                         help='Show this help message and exit.')
-    parser.add_argument('--version', '-V', dest='version', action='version', version='%(prog)s {}'.format(__version__),
+    parser.add_argument('--version', '-V', dest='version', action='version',
+                        version='%(prog)s {}'.format(_get_version()),
                         help="Show %(prog)s's version number and exit.")
     parser.add_argument('--once', '-1', dest='once', action='store_true',
                         help='Report query data only once.')
@@ -42,16 +123,10 @@ def parse_arguments():  # pylint: disable=too-many-branches,too-many-statements
     coloring.add_argument('--light', action='store_true',
                           help='Tweak visual results for light theme terminals in monitor mode.\n'
                                'Set variable `NVITOP_MONITOR_THEME="light"` on light terminals for convenience.')
-    gpu_thresholds = Device.GPU_UTILIZATION_THRESHOLDS
     coloring.add_argument('--gpu-util-thresh', type=int, nargs=2, choices=range(1, 100), metavar=('th1', 'th2'),
-                          help='Thresholds of GPU utilization to determine the load intensity.\n' +
-                               'Coloring rules: {}.\n'.format(coloring_rules) +
-                               '( 1 <= th1 < th2 <= 99, defaults: {} {} )'.format(*gpu_thresholds))
-    memory_thresholds = Device.MEMORY_UTILIZATION_THRESHOLDS
+                          help=_LazyHelp(gpu_thresh_help))
     coloring.add_argument('--mem-util-thresh', type=int, nargs=2, choices=range(1, 100), metavar=('th1', 'th2'),
-                          help='Thresholds of GPU memory percent to determine the load intensity.\n' +
-                               'Coloring rules: {}.\n'.format(coloring_rules) +
-                               '( 1 <= th1 < th2 <= 99, defaults: {} {} )'.format(*memory_thresholds))
+                          help=_LazyHelp(mem_thresh_help))
 
     device_filtering = parser.add_argument_group('device filtering')
     device_filtering.add_argument('--only', '-o', dest='only', type=int, nargs='+', metavar='idx',
@@ -69,39 +144,58 @@ def parse_arguments():  # pylint: disable=too-many-branches,too-many-statements
     process_filtering.add_argument('--pid', '-p', dest='pid', type=int, nargs='+', metavar='PID',
                                    help='Only show processes of the given PIDs.')
 
-    args = parser.parse_args()
+    return parser.parse_args()
+
+
+def _parse_thresholds(value):
+    """Parse a 'th1,th2' environment value into a validated two-int list, or None."""
+    try:
+        thresholds = list(map(int, value.split(',')))[:2]
+        if len(thresholds) != 2 or min(thresholds) <= 0 or max(thresholds) >= 100:
+            raise ValueError
+    except (ValueError, AttributeError):
+        return None
+    return thresholds
 
+
+def parse_arguments():
+    args = _fast_parse_arguments()
+    if args is None:
+        args = _full_parse_arguments()
+
+    env = os.environ
     if not args.light:
-        args.light = (os.getenv('NVITOP_MONITOR_THEME', 'dark').lower() == 'light')
+        args.light = (env.get('NVITOP_MONITOR_THEME', 'dark').lower() == 'light')
     if args.user is not None and len(args.user) == 0:
+        from nvitop.gui import USERNAME  # pylint: disable=import-outside-toplevel
+
         args.user.append(USERNAME)
     if args.gpu_util_thresh is None:
-        try:
-            gpu_util_thresh = os.getenv('NVITOP_GPU_UTILIZATION_THRESHOLDS', None)
-            gpu_util_thresh = list(map(int, gpu_util_thresh.split(',')))[:2]
-            if len(gpu_util_thresh) != 2 or min(gpu_util_thresh) <= 0 or max(gpu_util_thresh) >= 100:
-                raise ValueError
-        except (ValueError, AttributeError):
-            pass
-        else:
-            args.gpu_util_thresh = gpu_util_thresh
+        args.gpu_util_thresh = _parse_thresholds(env.get('NVITOP_GPU_UTILIZATION_THRESHOLDS'))
     if args.mem_util_thresh is None:
-        try:
-            mem_util_thresh = os.getenv('NVITOP_MEMORY_UTILIZATION_THRESHOLDS', None)
-            mem_util_thresh = list(map(int, mem_util_thresh.split(',')))[:2]
-            if len(mem_util_thresh) != 2 or min(mem_util_thresh) <= 0 or max(mem_util_thresh) >= 100:
-                raise ValueError
-        except (ValueError, AttributeError):
-            pass
-        else:
-            args.mem_util_thresh = mem_util_thresh
+        args.mem_util_thresh = _parse_thresholds(env.get('NVITOP_MEMORY_UTILIZATION_THRESHOLDS'))
 
     return args
 
 
 def main():  # pylint: disable=too-many-branches,too-many-statements,too-many-locals
+    # Fast path for `nvitop --version`: the version string is all we need, so skip
+    # parser construction (and the imports it drags in) entirely.
+    if len(sys.argv) >= 2 and sys.argv[1] in ('-V', '--version'):
+        print('nvitop {}'.format(_get_version()))
+        return 0
+
     args = parse_arguments()
 
+    # Import the heavy dependencies only after argument parsing succeeded, so that
+    # `--help`/`--version` and argument errors do not pay the full import cost.
+    from nvitop.core import nvml, HostProcess, boolify  # pylint: disable=import-outside-toplevel
+    from nvitop.gui import (Top, Device, libcurses,  # pylint: disable=import-outside-toplevel
+                            setlocale_utf8, colored, set_color)
+
+    env = os.environ
+    tty = _is_tty()
+
     if args.force_color:
         set_color(True)
 
@@ -110,16 +204,16 @@ def main():  # pylint: disable=too-many-branches,too-many-statements,too-many-lo
         messages.append('ERROR: Both `--once` and `--monitor` switches are on.')
         del args.monitor
 
-    if not args.once and not hasattr(args, 'monitor') and TTY \
-            and boolify(os.getenv('NVITOP_MONITOR_ALWAYS', 'true'), default=True):
+    if not args.once and not hasattr(args, 'monitor') and tty \
+            and boolify(env.get('NVITOP_MONITOR_ALWAYS', 'true'), default=True):
         args.monitor = None
 
-    if hasattr(args, 'monitor') and not TTY:
+    if hasattr(args, 'monitor') and not tty:
         messages.append('ERROR: You must run monitor mode from a TTY terminal.')
         del args.monitor
 
     if hasattr(args, 'monitor') and args.monitor is None:
-        mode = os.getenv('NVITOP_MONITOR_MODE', 'auto').lower()
+        mode = env.get('NVITOP_MONITOR_MODE', 'auto').lower()
         if mode not in ('auto', 'full', 'compact'):
             mode = 'auto'
         args.monitor = mode
@@ -141,33 +235,45 @@ def main():  # pylint: disable=too-many-branches,too-many-statements,too-many-lo
         Device.MEMORY_UTILIZATION_THRESHOLDS = tuple(sorted(args.mem_util_thresh))
 
     if args.only is not None:
-        indices = set(args.only)
-        invalid_indices = indices.difference(range(device_count))
-        indices.intersection_update(range(device_count))
+        indices = args.only
+        invalid_indices = sorted({index for index in indices if not 0 <= index < device_count})
+        indices = [index for index in indices if 0 <= index < device_count]
         if len(invalid_indices) > 1:
-            messages.append('ERROR: Invalid device indices: {}.'.format(sorted(invalid_indices)))
+            messages.append('ERROR: Invalid device indices: {}.'.format(invalid_indices))
         elif len(invalid_indices) == 1:
-            messages.append('ERROR: Invalid device index: {}.'.format(list(invalid_indices)[0]))
+            messages.append('ERROR: Invalid device index: {}.'.format(invalid_indices[0]))
     elif args.only_visible:
         indices = Device.parse_cuda_visible_devices()
     else:
         indices = range(device_count)
-    devices = Device.from_indices(sorted(set(indices)))
+    # `range` is already sorted and duplicate-free; only the explicit index lists
+    # need the dedup-and-sort treatment.
+    devices = Device.from_indices(list(indices) if isinstance(indices, range)
+                                  else sorted(set(indices)))
 
-    filters = []
+    # Compose the active checks into one short-circuit predicate instead of
+    # stacking a closure per filter on the per-process hot path.
+    checks = []
+    check_globals = {}
     if args.compute:
-        filters.append(lambda process: 'C' in process.type)
+        checks.append("'C' in process.type")
     if args.graphics:
-        filters.append(lambda process: 'G' in process.type)
+        checks.append("'G' in process.type")
     if args.user is not None:
-        users = set(args.user)
-        filters.append(lambda process: process.username in users)
+        check_globals['users'] = set(args.user)
+        checks.append('process.username in users')
     if args.pid is not None:
-        pids = set(args.pid)
-        filters.append(lambda process: process.pid in pids)
+        check_globals['pids'] = set(args.pid)
+        checks.append('process.pid in pids')
+    filters = []
+    if len(checks) > 0:
+        filters.append(eval('lambda process: ' + ' and '.join(checks),  # pylint: disable=eval-used
+                            check_globals))
 
     top = None
     if hasattr(args, 'monitor') and len(devices) > 0:
+        import curses  # pylint: disable=import-outside-toplevel
+
         try:
             with libcurses(light_theme=args.light) as win:
                 top = Top(devices, filters, ascii=args.ascii, mode=args.monitor, win=win)
@@ -179,7 +285,7 @@ def main():  # pylint: disable=too-many-branches,too-many-statements,too-many-lo
 
     if top is None:
         top = Top(devices, filters, ascii=args.ascii)
-        if not sys.stdout.isatty():
+        if not _stdout_isatty():
             parent = HostProcess().parent()
             grandparent = (parent.parent() if parent is not None else None)
             if grandparent is not None and parent.name() == 'sh' and grandparent.name() == 'watch':
@@ -4,15 +4,154 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
 # pylint: disable=disallowed-name,invalid-name
 
+import functools
+import re
 import threading
 import time
-
-from cachetools.func import ttl_cache
+from concurrent.futures import ThreadPoolExecutor
 
 from nvitop.gui.library import (host, Device,
                                 Displayable, colored, cut_string, make_bar)
 
 
+# Utilization values only change once per SNAPSHOT_INTERVAL while redraws happen
+# ~10x/s, so most frames can reuse the bar string built for the previous frame.
+_cached_make_bar = functools.lru_cache(maxsize=256)(make_bar)
+
+
+_ON_OFF = {'Enabled': 'On', 'Disabled': 'Off'}
+_ON_OFF_RE = re.compile('|'.join(map(re.escape, _ON_OFF)))
+
+
+def _on_off(s):
+    """Map 'Enabled'/'Disabled' to 'On'/'Off' in a single pass instead of two
+    chained str.replace() calls, each of which allocates and rescans the string."""
+    return _ON_OFF_RE.sub(lambda match: _ON_OFF[match.group()], s)
+
+
+# Memoized normalization of the snapshot string fields. The raw values (device
+# name, compute mode, display active, ...) almost never change between polls, so
+# after the first poll each of these is a single dict hit per field per snapshot.
+_NAME_CACHE = {}
+_DRIVER_MODEL_CACHE = {}
+_ON_OFF_CACHE = {}
+_MIG_MODE_CACHE = {}
+_COMPUTE_MODE_CACHE = {}
+
+
+def _normalized(cache, raw, normalize):
+    try:
+        return cache[raw]
+    except KeyError:
+        value = cache[raw] = normalize(raw)
+        return value
+
+
+def _normalize_name(raw):
+    name = raw
+    if name.startswith('NVIDIA '):
+        name = name[len('NVIDIA '):]
+    return cut_string(name, maxlen=18, padstr='..', align='right')
+
+
+def _normalize_driver_model(raw):
+    return raw.replace('WDM', 'TCC')
+
+
+def _normalize_mig_mode(raw):
+    return raw.replace('N/A', 'N/A ')
+
+
+def _normalize_compute_mode(raw):
+    return raw.replace('Exclusive', 'E.')
+
+
+# The frame only changes on resize or layout switches, so the borders are cached
+# on their parameters rather than rebuilt with string multiplication every call.
+# The cached tuples are shared; callers get fresh lists from the panel methods.
+@functools.lru_cache(maxsize=8)
+def _make_header_lines(compact, device_count, support_mig, driver_version, cuda_version):
+    header = [
+        '╒═════════════════════════════════════════════════════════════════════════════╕',
+        '│ NVIDIA-SMI {0:<12} Driver Version: {0:<12} CUDA Version: {1:<8} │'.format(driver_version,
+                                                                                     cuda_version),
+    ]
+    if device_count > 0:
+        header.append('├───────────────────────────────┬──────────────────────┬──────────────────────┤')
+        if compact:
+            header.append('│ GPU Fan Temp Perf Pwr:Usg/Cap │         Memory-Usage │ GPU-Util  Compute M. │')
+        else:
+            header.extend([
+                '│ GPU  Name        Persistence-M│ Bus-Id        Disp.A │ Volatile Uncorr. ECC │',
+                '│ Fan  Temp  Perf  Pwr:Usage/Cap│         Memory-Usage │ GPU-Util  Compute M. │',
+            ])
+            if host.WINDOWS:
+                header[-2] = header[-2].replace('Persistence-M', '    TCC/WDDM ')
+            if support_mig:
+                header[-2] = header[-2].replace('Volatile Uncorr. ECC', 'MIG M.   Uncorr. ECC')
+        header.append('╞═══════════════════════════════╪══════════════════════╪══════════════════════╡')
+    else:
+        header.extend([
+            '╞═════════════════════════════════════════════════════════════════════════════╡',
+            '│  No visible devices found                                                   │',
+            '╘═════════════════════════════════════════════════════════════════════════════╛',
+        ])
+    return tuple(header)
+
+
+@functools.lru_cache(maxsize=8)
+def _make_frame_lines(width, compact, device_count, support_mig,  # pylint: disable=too-many-arguments
+                      driver_version, cuda_version):
+    frame = list(_make_header_lines(compact, device_count, support_mig, driver_version, cuda_version))
+
+    remaining_width = width - 79
+    data_line = '│                               │                      │                      │'
+    separator_line = '├───────────────────────────────┼──────────────────────┼──────────────────────┤'
+    if width >= 100:
+        data_line += ' ' * (remaining_width - 1) + '│'
+        separator_line = separator_line[:-1] + '┼' + '─' * (remaining_width - 1) + '┤'
+
+    if device_count > 0:
+        if compact:
+            frame.extend(device_count * [data_line, separator_line])
+        else:
+            frame.extend(device_count * [data_line, data_line, separator_line])
+        frame.pop()
+        frame.append('╘═══════════════════════════════╧══════════════════════╧══════════════════════╛')
+        if width >= 100:
+            frame[5 - int(compact)] = frame[5 - int(compact)][:-1] + '╪' + '═' * (remaining_width - 1) + '╕'
+            frame[-1] = frame[-1][:-1] + '╧' + '═' * (remaining_width - 1) + '╛'
+
+    return tuple(frame)
+
+
+@functools.lru_cache(maxsize=4)
+def _make_print_template(width, device_count, support_mig, driver_version, cuda_version):
+    """Structural lines for print(): the header (with its bar-area extension on wide
+    terminals), the between-devices separator and the footer. Only the per-device
+    rows are left for print() to fill in."""
+    header = list(_make_header_lines(False, device_count, support_mig, driver_version, cuda_version))
+    separator = '├───────────────────────────────┼──────────────────────┼──────────────────────┤'
+    footer = '╘═══════════════════════════════╧══════════════════════╧══════════════════════╛'
+    if device_count > 0 and width >= 100:
+        remaining_width = width - 79
+        header[-1] = header[-1][:-1] + '╪' + '═' * (remaining_width - 1) + '╕'
+        separator = separator[:-1] + '┼' + '─' * (remaining_width - 1) + '┤'
+        footer = footer[:-1] + '╧' + '═' * (remaining_width - 1) + '╛'
+    return tuple(header), separator, footer
+
+
+def _compile_formats(formats):
+    """Compile '{field:spec}'-style format strings into functions taking the snapshot
+    directly, so that drawing skips the per-call field parsing and attribute-dict
+    unpacking of `fmt.format(**snapshot.__dict__)`."""
+    compiled = []
+    for fmt in formats:
+        source = 'lambda d: f{!r}'.format(re.sub(r'\{(\w+)', r'{d.\1', fmt))
+        compiled.append(eval(source))  # pylint: disable=eval-used
+    return compiled
+
+
 class DevicePanel(Displayable):  # pylint: disable=too-many-instance-attributes
     NAME = 'device'
 
@@ -38,10 +177,20 @@ class DevicePanel(Displayable):  # pylint: disable=too-many-instance-attributes
         self._snapshot_buffer = []
         self._snapshots = []
         self.snapshot_lock = threading.Lock()
+        # The per-device NVML queries are independent blocking RPCs, so polling the
+        # devices concurrently bounds the snapshot latency by the slowest device
+        # rather than the sum of them all.
+        self._snapshot_pool = ThreadPoolExecutor(max_workers=min(8, self.device_count or 1),
+                                                 thread_name_prefix='device-snapshot-worker')
+        self._last_snapshot_time = 0.0
+        self._last_snapshot_result = None
+        self._last_draw_sig = None
+        self._skip_draw = False
         self.snapshots = self.take_snapshots()
         self._snapshot_daemon = threading.Thread(name='device-snapshot-daemon',
                                                  target=self._snapshot_target, daemon=True)
-        self._daemon_running = threading.Event()
+        self._daemon_started = False
+        self._stop_event = threading.Event()
 
         self.formats_compact = [
             '│ {index:>3} {fan_speed_string:>3} {temperature_string:>4} {performance_state:>3} {power_status:>12} '
@@ -64,6 +213,9 @@ class DevicePanel(Displayable):  # pylint: disable=too-many-instance-attributes
                 '{mig_mode:>8}  {total_volatile_uncorrected_ecc_errors:>10}',
             )
 
+        self._formatters_compact = _compile_formats(self.formats_compact)
+        self._formatters_full = _compile_formats(self.formats_full)
+
     @property
     def width(self):
         return self._width
@@ -95,102 +247,91 @@ class DevicePanel(Displayable):  # pylint: disable=too-many-instance-attributes
         with self.snapshot_lock:
             self._snapshots = snapshots
 
-    @ttl_cache(ttl=1.0)
     def take_snapshots(self):
-        snapshots = list(map(lambda device: device.as_snapshot(), self.devices))
+        # There is a single zero-argument caller, so a full TTL cache (dict lookup,
+        # lock and wrapper call per invocation) is overkill: a plain monotonic-time
+        # check gives the same 1-second reuse window.
+        now = time.monotonic()
+        if now - self._last_snapshot_time < 1.0 and self._last_snapshot_result is not None:
+            return self._last_snapshot_result
+
+        snapshots = list(self._snapshot_pool.map(lambda device: device.as_snapshot(), self.devices))
 
         for device in snapshots:
-            if device.name.startswith('NVIDIA '):
-                device.name = device.name.replace('NVIDIA ', '', 1)
-            device.name = cut_string(device.name, maxlen=18, padstr='..', align='right')
-            device.current_driver_model = device.current_driver_model.replace('WDM', 'TCC')
-            device.display_active = device.display_active.replace('Enabled', 'On').replace('Disabled', 'Off')
-            device.persistence_mode = device.persistence_mode.replace('Enabled', 'On').replace('Disabled', 'Off')
-            device.mig_mode = device.mig_mode.replace('N/A', 'N/A ')
-            device.compute_mode = device.compute_mode.replace('Exclusive', 'E.')
+            device.name = _normalized(_NAME_CACHE, device.name, _normalize_name)
+            device.current_driver_model = _normalized(_DRIVER_MODEL_CACHE,
+                                                      device.current_driver_model, _normalize_driver_model)
+            device.display_active = _normalized(_ON_OFF_CACHE, device.display_active, _on_off)
+            device.persistence_mode = _normalized(_ON_OFF_CACHE, device.persistence_mode, _on_off)
+            device.mig_mode = _normalized(_MIG_MODE_CACHE, device.mig_mode, _normalize_mig_mode)
+            device.compute_mode = _normalized(_COMPUTE_MODE_CACHE, device.compute_mode, _normalize_compute_mode)
             if device.fan_speed >= 100:
                 device.fan_speed_string = 'MAX'
 
         with self.snapshot_lock:
             self._snapshot_buffer = snapshots
 
+        self._last_snapshot_time = now
+        self._last_snapshot_result = snapshots
         return snapshots
 
     def _snapshot_target(self):
-        self._daemon_running.wait()
-        while self._daemon_running.is_set():
+        while not self._stop_event.is_set():
             self.take_snapshots()
-            time.sleep(self.SNAPSHOT_INTERVAL)
+            # Event.wait doubles as an interruptible sleep: destroy() wakes the
+            # daemon immediately instead of it dozing through a full interval.
+            if self._stop_event.wait(self.SNAPSHOT_INTERVAL):
+                break
 
     def header_lines(self, compact=None):
         if compact is None:
             compact = self.compact
-
-        header = [
-            '╒═════════════════════════════════════════════════════════════════════════════╕',
-            '│ NVIDIA-SMI {0:<12} Driver Version: {0:<12} CUDA Version: {1:<8} │'.format(self.driver_version,
-                                                                                         self.cuda_version),
-        ]
-        if self.device_count > 0:
-            header.append('├───────────────────────────────┬──────────────────────┬──────────────────────┤')
-            if compact:
-                header.append('│ GPU Fan Temp Perf Pwr:Usg/Cap │         Memory-Usage │ GPU-Util  Compute M. │')
-            else:
-                header.extend([
-                    '│ GPU  Name        Persistence-M│ Bus-Id        Disp.A │ Volatile Uncorr. ECC │',
-                    '│ Fan  Temp  Perf  Pwr:Usage/Cap│         Memory-Usage │ GPU-Util  Compute M. │',
-                ])
-                if host.WINDOWS:
-                    header[-2] = header[-2].replace('Persistence-M', '    TCC/WDDM ')
-                if self.support_mig:
-                    header[-2] = header[-2].replace('Volatile Uncorr. ECC', 'MIG M.   Uncorr. ECC')
-            header.append('╞═══════════════════════════════╪══════════════════════╪══════════════════════╡')
-        else:
-            header.extend([
-                '╞═════════════════════════════════════════════════════════════════════════════╡',
-                '│  No visible devices found                                                   │',
-                '╘═════════════════════════════════════════════════════════════════════════════╛',
-            ])
-        return header
+        return list(_make_header_lines(compact, self.device_count, self.support_mig,
+                                       self.driver_version, self.cuda_version))
 
     def frame_lines(self, compact=None):
         if compact is None:
             compact = self.compact
-
-        frame = self.header_lines(compact)
-
-        remaining_width = self.width - 79
-        data_line = '│                               │                      │                      │'
-        separator_line = '├───────────────────────────────┼──────────────────────┼──────────────────────┤'
-        if self.width >= 100:
-            data_line += ' ' * (remaining_width - 1) + '│'
-            separator_line = separator_line[:-1] + '┼' + '─' * (remaining_width - 1) + '┤'
-
-        if self.device_count > 0:
-            if compact:
-                frame.extend(self.device_count * [data_line, separator_line])
-            else:
-                frame.extend(self.device_count * [data_line, data_line, separator_line])
-            frame.pop()
-            frame.append('╘═══════════════════════════════╧══════════════════════╧══════════════════════╛')
-            if self.width >= 100:
-                frame[5 - int(compact)] = frame[5 - int(compact)][:-1] + '╪' + '═' * (remaining_width - 1) + '╕'
-                frame[-1] = frame[-1][:-1] + '╧' + '═' * (remaining_width - 1) + '╛'
-
-        return frame
+        return list(_make_frame_lines(self.width, compact, self.device_count, self.support_mig,
+                                      self.driver_version, self.cuda_version))
 
     def poke(self):
-        if not self._daemon_running.is_set():
-            self._daemon_running.set()
+        if not self._daemon_started:
+            self._daemon_started = True
             self._snapshot_daemon.start()
 
         self.snapshots = self._snapshot_buffer
 
+        # Most ticks redraw identical content: snapshots refresh every 0.7s while
+        # the screen refreshes ~10x/s. Fingerprint everything the panel renders
+        # (including the selection, which drives the bold/dim attributes) so that
+        # draw() can skip the per-device work on unchanged frames.
+        try:
+            selected_device = self.parent.selected.process.device
+        except AttributeError:
+            selected_device = None
+        sig = (self.compact, self.width, selected_device,
+               tuple((device.name, device.fan_speed_string, device.temperature_string,
+                      device.performance_state, device.power_status, device.memory_usage,
+                      device.gpu_utilization_string, device.compute_mode,
+                      device.display_active, device.persistence_mode, device.current_driver_model,
+                      device.mig_mode, device.total_volatile_uncorrected_ecc_errors,
+                      device.memory_percent, device.gpu_utilization,
+                      device.display_color, device.memory_display_color, device.gpu_display_color)
+                     for device in self._snapshots))
+        self._skip_draw = (sig == self._last_draw_sig)
+        self._last_draw_sig = sig
+
         super().poke()
 
-    def draw(self):  # pylint: disable=too-many-locals,too-many-branches
+    def draw(self):  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
         self.color_reset()
 
+        if self._skip_draw and not self.need_redraw:
+            # Unchanged contents: only the clock line needs refreshing.
+            self.addstr(self.y, self.x, cut_string(time.strftime('%a %b %d %H:%M:%S %Y'), maxlen=32))
+            return
+
         if self.need_redraw:
             self.addstr(self.y, self.x, '(Press h for help or q to quit)'.rjust(79))
             self.color_at(self.y, self.x + 55, width=1, fg='magenta', attr='bold | italic')
@@ -201,9 +342,15 @@ class DevicePanel(Displayable):  # pylint: disable=too-many-instance-attributes
         self.addstr(self.y, self.x, cut_string(time.strftime('%a %b %d %H:%M:%S %Y'), maxlen=32))
 
         if self.compact:
-            formats = self.formats_compact
+            formats = self._formatters_compact
         else:
-            formats = self.formats_full
+            formats = self._formatters_full
+
+        # Bind the hot attributes to locals: the loop below runs per device per
+        # frame, and local loads are much cheaper than repeated LOAD_ATTR chains.
+        addstr = self.addstr
+        color_at = self.color_at
+        x = self.x
 
         remaining_width = self.width - 79
         draw_bars = (self.width >= 100)
@@ -213,95 +360,104 @@ class DevicePanel(Displayable):  # pylint: disable=too-many-instance-attributes
             selected_device = None
         for index, device in enumerate(self.snapshots):
             y_start = self.y + 4 + (len(formats) + 1) * (index + 1)
+            display_color = device.display_color
             if selected_device is not None:
                 attr = ('bold' if device.real == selected_device else 'dim')
             else:
                 attr = 0
 
-            for y, fmt in enumerate(formats, start=y_start):
-                self.addstr(y, self.x, fmt.format(**device.__dict__))
-                self.color_at(y, self.x + 1, width=31, fg=device.display_color, attr=attr)
-                self.color_at(y, self.x + 33, width=22, fg=device.display_color, attr=attr)
-                self.color_at(y, self.x + 56, width=22, fg=device.display_color, attr=attr)
-
+            # Compose each row (device columns plus its utilization bar) into a
+            # single string so that only one addstr call per row crosses into
+            # curses; the coloring is issued afterwards over the known ranges.
+            rows = [fmt(device) for fmt in formats]
+            bar_colors = []
             if draw_bars:
-                matrix = [
-                    (0, y_start, remaining_width - 3,
-                     'MEM', device.memory_percent, device.memory_display_color),
-                    (0, y_start + 1, remaining_width - 3,
-                     'UTL', device.gpu_utilization, device.gpu_display_color),
-                ]
                 if self.compact:
                     if remaining_width >= 44:
                         left_width = (remaining_width - 6 + 1) // 2 - 1
                         right_width = (remaining_width - 6) // 2 + 1
-                        matrix = [
-                            (0, y_start, left_width,
-                             'MEM', device.memory_percent, device.memory_display_color),
-                            (left_width + 3, y_start, right_width,
-                             'UTL', device.gpu_utilization, device.gpu_display_color),
-                        ]
-                        self.addstr(y_start - 1, self.x + 80 + left_width + 1, '┼' if index > 0 else '╤')
-                        self.addstr(y_start, self.x + 80 + left_width + 1, '│')
+                        rows[0] += ' {} │ {}'.format(
+                            _cached_make_bar('MEM', device.memory_percent, width=left_width),
+                            _cached_make_bar('UTL', device.gpu_utilization, width=right_width),
+                        )
+                        bar_colors = [(y_start, 0, left_width, device.memory_display_color),
+                                      (y_start, left_width + 3, right_width, device.gpu_display_color)]
+                        addstr(y_start - 1, x + 80 + left_width + 1, '┼' if index > 0 else '╤')
                         if index == len(self.snapshots) - 1:
-                            self.addstr(y_start + 1, self.x + 80 + left_width + 1, '╧')
+                            addstr(y_start + 1, x + 80 + left_width + 1, '╧')
                     else:
-                        matrix.pop()
-                for x_offset, y, width, prefix, utilization, color in matrix:
-                    bar = make_bar(prefix, utilization, width=width)
-                    self.addstr(y, self.x + 80 + x_offset, bar)
-                    self.color_at(y, self.x + 80 + x_offset, width=width, fg=color, attr=attr)
+                        rows[0] += ' ' + _cached_make_bar('MEM', device.memory_percent,
+                                                          width=remaining_width - 3)
+                        bar_colors = [(y_start, 0, remaining_width - 3, device.memory_display_color)]
+                else:
+                    rows[0] += ' ' + _cached_make_bar('MEM', device.memory_percent,
+                                                      width=remaining_width - 3)
+                    rows[1] += ' ' + _cached_make_bar('UTL', device.gpu_utilization,
+                                                      width=remaining_width - 3)
+                    bar_colors = [(y_start, 0, remaining_width - 3, device.memory_display_color),
+                                  (y_start + 1, 0, remaining_width - 3, device.gpu_display_color)]
+
+            for y, line in enumerate(rows, start=y_start):
+                addstr(y, x, line)
+                color_at(y, x + 1, width=31, fg=display_color, attr=attr)
+                color_at(y, x + 33, width=22, fg=display_color, attr=attr)
+                color_at(y, x + 56, width=22, fg=display_color, attr=attr)
+            for y, x_offset, width, color in bar_colors:
+                color_at(y, x + 80 + x_offset, width=width, fg=color, attr=attr)
 
     def destroy(self):
         super().destroy()
-        self._daemon_running.clear()
+        self._stop_event.set()
+        if self._daemon_started:
+            # Wait the daemon out before closing the pool: a shut-down pool raises
+            # RuntimeError if the daemon is just about to schedule its next poll.
+            # The join is quick because the stop event interrupts the daemon sleep.
+            self._snapshot_daemon.join()
+        self._snapshot_pool.shutdown(wait=False)
 
     def print_width(self):
         if self.device_count > 0 and self.width >= 100:
             return self.width
         return 79
 
-    def print(self):
-        lines = [time.strftime('%a %b %d %H:%M:%S %Y'), *self.header_lines(compact=False)]
+    def print(self):  # pylint: disable=too-many-locals
+        header, separator, footer = _make_print_template(self.width, self.device_count,
+                                                         self.support_mig,
+                                                         self.driver_version, self.cuda_version)
+        lines = [time.strftime('%a %b %d %H:%M:%S %Y'), *header]
 
         if self.device_count > 0:
-            for device in self.snapshots:
-                def colorize(s):
-                    if len(s) > 0:
-                        return colored(s, device.display_color)  # pylint: disable=cell-var-from-loop
-                    return ''
-
-                for fmt in self.formats_full:
-                    line = fmt.format(**device.__dict__)
-                    lines.append('│'.join(map(colorize, line.split('│'))))
-
-                lines.append('├───────────────────────────────┼──────────────────────┼──────────────────────┤')
-            lines.pop()
-            lines.append('╘═══════════════════════════════╧══════════════════════╧══════════════════════╛')
-
-            if self.width >= 100:
-                remaining_width = self.width - 79
-                for index, device in enumerate(self.snapshots):
-                    y_start = 4 + 3 * (index + 1)
-                    lines[y_start - 1] = lines[y_start - 1][:-1]
-
-                    if index == 0:
-                        lines[y_start - 1] += '╪' + '═' * (remaining_width - 1) + '╕'
-                    else:
-                        lines[y_start - 1] += '┼' + '─' * (remaining_width - 1) + '┤'
-
+            # Resolve the ANSI escape pair once per display color, instead of routing
+            # every row segment through colored() and its color-name lookups. With
+            # coloring disabled the pairs degenerate to empty strings.
+            ansi = {}
+            for color in Device.INTENSITY2COLOR.values():
+                escape_start, _, escape_end = colored('\0', color).partition('\0')
+                ansi[color] = (escape_start, escape_end)
+
+            remaining_width = self.width - 79
+            draw_bars = (self.width >= 100)
+            for index, device in enumerate(self.snapshots):
+                if index > 0:
+                    lines.append(separator)
+
+                escape_start, escape_end = ansi[device.display_color]
+                rows = ['│'.join('{}{}{}'.format(escape_start, segment, escape_end) if segment else ''
+                                 for segment in fmt(device).split('│'))
+                        for fmt in self._formatters_full]
+                if draw_bars:
                     matrix = [
                         ('MEM', device.memory_percent,
                          Device.INTENSITY2COLOR[device.memory_loading_intensity]),
                         ('UTL', device.gpu_utilization,
                          Device.INTENSITY2COLOR[device.gpu_loading_intensity]),
                     ]
-                    for y, (prefix, utilization, color) in enumerate(matrix, start=y_start):
-                        bar = make_bar(prefix, utilization, width=remaining_width - 3)
-                        lines[y] += ' {} │'.format(colored(bar, color))
-
-                    if index == len(self.snapshots) - 1:
-                        lines[y_start + 2] = lines[y_start + 2][:-1] + '╧' + '═' * (remaining_width - 1) + '╛'
+                    for y, (prefix, utilization, color) in enumerate(matrix):
+                        bar = _cached_make_bar(prefix, utilization, width=remaining_width - 3)
+                        bar_start, bar_end = ansi[color]
+                        rows[y] += ' {}{}{} │'.format(bar_start, bar, bar_end)
+                lines.extend(rows)
+            lines.append(footer)
 
         lines = '\n'.join(lines)
         if self.ascii: